@@ -1,7 +1,11 @@
 import os
 import sys
+import threading
 import ctypes
-from ctypes import c_int, c_double, c_char_p, c_bool, POINTER, byref, c_uint16
+from ctypes import c_int, c_double, c_char_p, c_bool, c_void_p, POINTER, create_string_buffer
+from typing import Any, List, Tuple
+
+import numpy as np
 
 # Error codes
 ERROR_NONE = 0
@@ -114,175 +118,201 @@ ADC_GAIN_X2 = 1
 ADC_GAIN_X4 = 2
 
 
+_PKG_ROOT = os.path.dirname(os.path.abspath(__file__))
+_LIB_DIR = os.path.join(_PKG_ROOT, '..', 'lib')
+
+# Candidate library paths per platform, in order of preference. On Windows the
+# statically linked build comes first: it carries its own runtime and USB
+# dependencies, so each call avoids indirections into other DLLs and nothing
+# else has to be installed. In exchange its DLL is larger, and the bundled
+# runtime and USB stack do not pick up system or driver updates until pyglaz
+# ships a rebuilt library. The dynamically linked build, which shares those
+# with the system, is the fallback; removing the -static directory selects it.
+_LIB_CANDIDATES = {
+    'win32_64': (
+        os.path.join(_LIB_DIR, 'win64-static', 'GlazLib.dll'),
+        os.path.join(_LIB_DIR, 'win64', 'GlazLib.dll'),
+    ),
+    'win32_32': (
+        os.path.join(_LIB_DIR, 'win32-static', 'GlazLib.dll'),
+        os.path.join(_LIB_DIR, 'win32', 'GlazLib.dll'),
+    ),
+    'linux': (
+        os.path.join(_LIB_DIR, 'linux64', 'libGlazLib.so.9.23.0'),
+    ),
+}
+
+
 def _find_library():
     """Find and load the GlazLib DLL."""
     # Determine the platform
     if sys.platform == 'win32':
-        if sys.maxsize > 2**32:  # 64-bit Python
-            lib_paths = [
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lib', 'win64', 'GlazLib.dll'),
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lib', 'win64-static', 'GlazLib.dll'),
-            ]
-        else:  # 32-bit Python
-            lib_paths = [
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lib', 'win32', 'GlazLib.dll'),
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lib', 'win32-static', 'GlazLib.dll'),
-            ]
-    elif sys.platform == 'linux':
-        lib_paths = [
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lib', 'linux64', 'libGlazLib.so.9.23.0'),
-        ]
+        platform_key = 'win32_64' if sys.maxsize > 2**32 else 'win32_32'
     else:
+        platform_key = sys.platform
+    lib_paths = _LIB_CANDIDATES.get(platform_key)
+    if lib_paths is None:
         raise RuntimeError(f"Unsupported platform: {sys.platform}")
 
-    # Try to load the library from the paths
+    # Try to load the library from the paths. CDLL (unlike PyDLL) releases the
+    # GIL around every call, so blocking calls such as runMeasurement do not
+    # stall other Python threads.
+    last_error = None
     for lib_path in lib_paths:
         if os.path.exists(lib_path):
             try:
-                return ctypes.cdll.LoadLibrary(lib_path)
+                return ctypes.CDLL(lib_path, mode=ctypes.RTLD_LOCAL)
             except OSError as e:
                 last_error = e
     
     # If we get here, we couldn't load the library
     error_msg = f"Could not find or load GlazLib library. Looked in: {', '.join(lib_paths)}"
+    if last_error is not None:
+        error_msg += f" (last error: {last_error})"
     raise RuntimeError(error_msg)
 
 
 # Load the GlazLib DLL
 _lib = _find_library()
 
-# Define function prototypes
-_lib.getVersion.argtypes = [POINTER(c_int), POINTER(c_int)]
-_lib.getVersion.restype = None
-
-_lib.getLastErrorMessage.argtypes = [c_char_p]
-_lib.getLastErrorMessage.restype = c_int
-
-_lib.getUSBParameters.argtypes = [POINTER(c_int), POINTER(c_int), POINTER(c_int)]
-_lib.getUSBParameters.restype = None
-
-_lib.setUSBParameters.argtypes = [c_int, c_int, c_int]
-_lib.setUSBParameters.restype = None
-
-_lib.enableDataStreamLog.argtypes = [c_bool]
-_lib.enableDataStreamLog.restype = None
-
-_lib.initialiseSession.argtypes = [c_char_p]
-_lib.initialiseSession.restype = c_int
-
-_lib.initialiseSingleDeviceSession.argtypes = [c_int, c_bool, c_bool]
-_lib.initialiseSingleDeviceSession.restype = c_int
-
-_lib.closeSession.argtypes = []
-_lib.closeSession.restype = c_int
-
-_lib.resetAllDevices.argtypes = []
-_lib.resetAllDevices.restype = None
-
-_lib.resetAllPorts.argtypes = []
-_lib.resetAllPorts.restype = None
-
-_lib.setTestMode.argtypes = [c_int]
-_lib.setTestMode.restype = c_int
-
-_lib.setWavelengths.argtypes = [c_double, c_double]
-_lib.setWavelengths.restype = c_int
-
-_lib.setHardwareAveraging.argtypes = [c_int]
-_lib.setHardwareAveraging.restype = c_int
-
-_lib.setResolution.argtypes = [c_int]
-_lib.setResolution.restype = c_int
-
-_lib.setScanCount.argtypes = [c_int]
-_lib.setScanCount.restype = c_int
-
-_lib.setScanClockSpeed.argtypes = [c_int]
-_lib.setScanClockSpeed.restype = c_int
-
-_lib.setADCGain.argtypes = [c_int]
-_lib.setADCGain.restype = c_int
-
-_lib.setTriggerDelay.argtypes = [c_int]
-_lib.setTriggerDelay.restype = c_int
-
-_lib.setTriggerMode.argtypes = [c_int]
-_lib.setTriggerMode.restype = c_int
-
-_lib.setInternalTriggerFrequency.argtypes = [c_double]
-_lib.setInternalTriggerFrequency.restype = c_int
-
-_lib.setIntegrationMode.argtypes = [c_int]
-_lib.setIntegrationMode.restype = c_int
-
-_lib.setIntegrationTime.argtypes = [c_int]
-_lib.setIntegrationTime.restype = c_int
 
-_lib.setSyncOutMode.argtypes = [c_int]
-_lib.setSyncOutMode.restype = c_int
-
-_lib.setSyncOutPolarity.argtypes = [c_int]
-_lib.setSyncOutPolarity.restype = c_int
-
-_lib.setAuxOutMode.argtypes = [c_int]
-_lib.setAuxOutMode.restype = c_int
-
-_lib.setAuxOutPolarity.argtypes = [c_int]
-_lib.setAuxOutPolarity.restype = c_int
-
-_lib.setOutCycleCount.argtypes = [c_int]
-_lib.setOutCycleCount.restype = c_int
-
-_lib.setTimeout.argtypes = [c_int]
-_lib.setTimeout.restype = c_int
-
-_lib.captureBackground.argtypes = [c_int]
-_lib.captureBackground.restype = c_int
-
-_lib.runMeasurement.argtypes = []
-_lib.runMeasurement.restype = c_int
-
-_lib.startMeasurement.argtypes = []
-_lib.startMeasurement.restype = c_int
-
-_lib.isMeasurementDone.argtypes = [POINTER(c_bool)]
-_lib.isMeasurementDone.restype = c_int
-
-_lib.getResult.argtypes = [c_int, POINTER(c_int), POINTER(c_double)]
-_lib.getResult.restype = c_int
-
-_lib.getComplexResult.argtypes = [c_int, POINTER(c_int), POINTER(c_double), POINTER(c_double)]
-_lib.getComplexResult.restype = c_int
-
-_lib.getTimeStamp.argtypes = [c_int, c_int, POINTER(c_double)]
-_lib.getTimeStamp.restype = c_int
-
-_lib.getScan.argtypes = [c_int, c_int, POINTER(c_int), POINTER(c_double)]
-_lib.getScan.restype = c_int
-
-_lib.getComplexScan.argtypes = [c_int, c_int, POINTER(c_int), POINTER(c_double), POINTER(c_double)]
-_lib.getComplexScan.restype = c_int
-
-_lib.getAllScansSizes.argtypes = [c_int, POINTER(c_int), POINTER(c_int)]
-_lib.getAllScansSizes.restype = c_int
-
-_lib.getAllScans.argtypes = [c_int, POINTER(c_uint16)]
-_lib.getAllScans.restype = c_int
-
-_lib.writeAllScansToFile.argtypes = [c_int, c_char_p, c_bool]
-_lib.writeAllScansToFile.restype = c_int
-
-_lib.getPDValues.argtypes = [c_int, c_int, POINTER(c_int), POINTER(c_double)]
-_lib.getPDValues.restype = c_int
-
-_lib.getPDReference.argtypes = [c_int, c_int, POINTER(c_double)]
-_lib.getPDReference.restype = c_int
-
-_lib.getAUXStates.argtypes = [c_int, POINTER(c_int), POINTER(c_bool)]
-_lib.getAUXStates.restype = c_int
-
-_lib.getAUXCycleCounts.argtypes = [c_int, c_int, POINTER(c_int), POINTER(c_int)]
-_lib.getAUXCycleCounts.restype = c_int
-
-_lib.runUSBCommsTest.argtypes = []
-_lib.runUSBCommsTest.restype = c_int
\ No newline at end of file
+def _ndpointer(dtype):
+    """
+    Build a ctypes argtype for writeable 1D C-contiguous NumPy arrays of the
+    given dtype, which the library fills as output buffers.
+    
+    Unlike a plain np.ctypeslib.ndpointer, None is also accepted and passed as
+    NULL, which the library uses to query result sizes.
+    """
+    base = np.ctypeslib.ndpointer(dtype=dtype, ndim=1, flags=('C_CONTIGUOUS', 'WRITEABLE'))
+
+    def from_param(cls, obj):
+        if obj is None:
+            return None
+        return base.from_param(obj)
+
+    return type(base.__name__ + '_or_null', (base,), {'from_param': classmethod(from_param)})
+
+
+_double_array = _ndpointer(np.float64)
+_bool_array = _ndpointer(np.bool_)
+_int_array = _ndpointer(np.intc)
+_scans_array = np.ctypeslib.ndpointer(dtype=np.uint16, flags=('C_CONTIGUOUS', 'WRITEABLE'))
+
+# Function prototypes: (name, argtypes, restype)
+_PROTOTYPES: Tuple[Tuple[str, List[Any], Any], ...] = (
+    ('getVersion', [POINTER(c_int), POINTER(c_int)], None),
+    ('getLastErrorMessage', [c_char_p], c_int),
+    ('getUSBParameters', [POINTER(c_int), POINTER(c_int), POINTER(c_int)], None),
+    ('setUSBParameters', [c_int, c_int, c_int], None),
+    ('enableDataStreamLog', [c_bool], None),
+    ('initialiseSession', [c_char_p], c_int),
+    ('initialiseSingleDeviceSession', [c_int, c_bool, c_bool], c_int),
+    ('closeSession', [], c_int),
+    ('resetAllDevices', [], None),
+    ('resetAllPorts', [], None),
+    ('setTestMode', [c_int], c_int),
+    ('setWavelengths', [c_double, c_double], c_int),
+    ('setHardwareAveraging', [c_int], c_int),
+    ('setResolution', [c_int], c_int),
+    ('setScanCount', [c_int], c_int),
+    ('setScanClockSpeed', [c_int], c_int),
+    ('setADCGain', [c_int], c_int),
+    ('setTriggerDelay', [c_int], c_int),
+    ('setTriggerMode', [c_int], c_int),
+    ('setInternalTriggerFrequency', [c_double], c_int),
+    ('setIntegrationMode', [c_int], c_int),
+    ('setIntegrationTime', [c_int], c_int),
+    ('setSyncOutMode', [c_int], c_int),
+    ('setSyncOutPolarity', [c_int], c_int),
+    ('setAuxOutMode', [c_int], c_int),
+    ('setAuxOutPolarity', [c_int], c_int),
+    ('setOutCycleCount', [c_int], c_int),
+    ('setTimeout', [c_int], c_int),
+    ('captureBackground', [c_int], c_int),
+    ('runMeasurement', [], c_int),
+    ('startMeasurement', [], c_int),
+    ('isMeasurementDone', [POINTER(c_bool)], c_int),
+    ('getResult', [c_int, POINTER(c_int), _double_array], c_int),
+    ('getComplexResult', [c_int, POINTER(c_int), _double_array, _double_array], c_int),
+    ('getTimeStamp', [c_int, c_int, POINTER(c_double)], c_int),
+    ('getScan', [c_int, c_int, POINTER(c_int), _double_array], c_int),
+    ('getComplexScan', [c_int, c_int, POINTER(c_int), _double_array, _double_array], c_int),
+    ('getAllScansSizes', [c_int, POINTER(c_int), POINTER(c_int)], c_int),
+    ('getAllScans', [c_int, _scans_array], c_int),
+    ('writeAllScansToFile', [c_int, c_char_p, c_bool], c_int),
+    ('getPDValues', [c_int, c_int, POINTER(c_int), _double_array], c_int),
+    ('getPDReference', [c_int, c_int, POINTER(c_double)], c_int),
+    ('getAUXStates', [c_int, POINTER(c_int), _bool_array], c_int),
+    ('getAUXCycleCounts', [c_int, c_int, POINTER(c_int), _int_array], c_int),
+    ('runUSBCommsTest', [], c_int),
+)
+
+for _name, _argtypes, _restype in _PROTOTYPES:
+    _func = getattr(_lib, _name)
+    _func.argtypes = _argtypes
+    _func.restype = _restype
+del _name, _argtypes, _restype, _func
+
+# Separate handle on getAllScans that takes a raw buffer address, for callers
+# that fill the same preallocated array repeatedly and want to skip the
+# per-call ndpointer checks
+_getAllScansAddress = _lib['getAllScans']
+_getAllScansAddress.argtypes = [c_int, c_void_p]
+_getAllScansAddress.restype = c_int
+
+
+class _ErrorBuffer(threading.local):
+    """Per-thread buffer for getLastErrorMessage."""
+
+    def __init__(self):
+        self.buffer = create_string_buffer(1024)
+
+
+_error_buffer = _ErrorBuffer()
+
+
+def get_last_error_message() -> str:
+    """Get the last error message from the library."""
+    buffer: ctypes.Array[ctypes.c_char] = _error_buffer.buffer
+    _lib.getLastErrorMessage(buffer)
+    return buffer.value.decode('utf-8')
+
+
+def _status_errcheck(description):
+    """Build an errcheck that raises RuntimeError for a non-zero status."""
+    prefix = f"Failed to {description}: "
+
+    def errcheck(status, func, args):
+        if status:
+            raise RuntimeError(prefix + get_last_error_message())
+        return status
+
+    return errcheck
+
+
+# Setters whose status is checked by ctypes itself: (name, description)
+_CHECKED_SETTERS = (
+    ('setTestMode', 'set test mode'),
+    ('setWavelengths', 'set wavelength range'),
+    ('setHardwareAveraging', 'set hardware averaging'),
+    ('setResolution', 'set resolution'),
+    ('setScanCount', 'set scan count'),
+    ('setScanClockSpeed', 'set scan clock speed'),
+    ('setADCGain', 'set ADC gain'),
+    ('setTriggerDelay', 'set trigger delay'),
+    ('setTriggerMode', 'set trigger mode'),
+    ('setInternalTriggerFrequency', 'set internal trigger frequency'),
+    ('setIntegrationMode', 'set integration mode'),
+    ('setIntegrationTime', 'set integration time'),
+    ('setSyncOutMode', 'set sync output mode'),
+    ('setSyncOutPolarity', 'set sync output polarity'),
+    ('setAuxOutMode', 'set auxiliary output mode'),
+    ('setAuxOutPolarity', 'set auxiliary output polarity'),
+    ('setOutCycleCount', 'set output cycle count'),
+    ('setTimeout', 'set timeout'),
+)
+
+for _name, _description in _CHECKED_SETTERS:
+    getattr(_lib, _name).errcheck = _status_errcheck(_description)
+del _name, _description
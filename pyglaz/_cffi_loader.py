@@ -0,0 +1,55 @@
+"""
+cffi ABI-mode bindings for GlazLib calls where ctypes call overhead matters.
+
+Used by the wrapper when cffi is installed (``pip install pyglaz[cffi]``);
+otherwise the ctypes prototypes in _bindings are used. The library is opened
+from the same path as the ctypes handle, so both share one loaded copy and one
+session.
+"""
+import threading
+
+from cffi import FFI
+
+from . import _bindings
+
+ffi = FFI()
+ffi.cdef("""
+    int getAUXCycleCounts(int index, int channel, int *size, int *counts);
+    int runUSBCommsTest(void);
+""")
+_lib = ffi.dlopen(_bindings._lib._name)
+
+
+class _Scratch(threading.local):
+    """Per-thread size out-parameter."""
+
+    def __init__(self):
+        self.size = ffi.new('int *')
+
+
+_scratch = _Scratch()
+
+
+def get_aux_cycle_counts(index, channel, counts, size):
+    """
+    Call getAUXCycleCounts.
+
+    Args:
+        index: Result index
+        channel: Channel index
+        counts: C int array to fill, or None to query the size only
+        size: Capacity of counts, ignored when only querying the size
+
+    Returns:
+        Tuple containing (status, size)
+    """
+    out_size = _scratch.size
+    out_size[0] = size
+    if counts is None:
+        status = _lib.getAUXCycleCounts(index, channel, out_size, ffi.NULL)
+    else:
+        status = _lib.getAUXCycleCounts(index, channel, out_size, ffi.from_buffer('int[]', counts))
+    return status, out_size[0]
+
+
+run_usb_comms_test = _lib.runUSBCommsTest
@@ -0,0 +1,12 @@
+"""
+Example scripts for the pyglaz package.
+
+Each module provides a main() function and is installed as a console script:
+
+- pyglaz-basic-example: configuration, blocking and non-blocking measurements
+- pyglaz-minimal-example: single spectrometer, one measurement
+- pyglaz-double-detectors-example: live plot of all scans from a second detector
+
+The plotting examples import matplotlib only once the device is up, so a failed
+bring-up fails fast without paying the plotting import cost.
+"""
@@ -1,15 +1,10 @@
 #!/usr/bin/env python
 # Basic example of using pyglaz library with XML configuration files
 
+import logging
 import os
-import sys
 
-# Add the parent directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-import time
 import numpy as np
-import matplotlib.pyplot as plt
 from pyglaz import GlazLib
 from pyglaz.utils import find_config_file, list_available_configs
 from pyglaz._bindings import (
@@ -19,7 +14,59 @@ from pyglaz._bindings import (
 )
 
 
+def _pyplot():
+    """
+    Import pyplot on first use, with the non-interactive Agg backend.
+
+    Plots are only saved to files here, so no GUI backend needs to start, and
+    a failed device bring-up never pays matplotlib's import cost. To show the
+    plots interactively, drop the matplotlib.use() call and add plt.show().
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _plot_spectrum(data):
+    """Save a line plot of a single spectrum."""
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(data)
+    ax.set_title("Spectrum Measurement")
+    ax.set_xlabel("Pixel")
+    ax.set_ylabel("Intensity")
+    ax.grid(True)
+    
+    # Save the plot
+    fig.savefig("spectrum_measurement.png")
+    plt.close(fig)
+    print("Saved plot to 'spectrum_measurement.png'")
+
+
+def _plot_all_scans(all_scans):
+    """Save a heatmap of all scans."""
+    plt = _pyplot()
+    # The raw uint16 scans are passed straight to imshow; to refresh the
+    # heatmap with new data, call im.set_data(new_scans) and im.autoscale()
+    # rather than imshow again.
+    fig, ax = plt.subplots(figsize=(10, 6))
+    im = ax.imshow(all_scans, aspect='auto', interpolation='nearest')
+    fig.colorbar(im, ax=ax, label='Intensity')
+    ax.set_title("All Scans")
+    ax.set_xlabel("Pixel")
+    ax.set_ylabel("Scan Number")
+    
+    # Save the plot
+    fig.savefig("all_scans.png")
+    plt.close(fig)
+    print("Saved all scans plot to 'all_scans.png'")
+
+
 def main():
+    # Show the library's informational messages, e.g. which config file is used
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # List available configuration files
     print("Available configuration files:")
     configs = list_available_configs()
@@ -54,18 +101,14 @@ def main():
         # but we can adjust some settings if needed
         print("Fine-tuning device settings...")
         
-        # Set to internal trigger mode
-        glaz.set_trigger_mode(TRIGGER_INTERNAL)
-        
-        # Set internal trigger frequency (Hz)
-        glaz.set_internal_trigger_frequency(100.0)
-        
-        # Set hardware averaging to improve signal quality
-        # Changed from 16 to 8 to stay within the valid range [0..8]
-        glaz.set_hardware_averaging(8)
-        
-        # Set scan count
-        glaz.set_scan_count(10)
+        glaz.configure(
+            trigger_mode=TRIGGER_INTERNAL,  # Set to internal trigger mode
+            internal_trigger_frequency=100.0,  # Internal trigger frequency (Hz)
+            # Hardware averaging improves signal quality
+            # Changed from 16 to 8 to stay within the valid range [0..8]
+            hardware_averaging=8,
+            scan_count=10,
+        )
 
         # Capture background (optional but recommended)
         print("Capturing background...")
@@ -83,20 +126,7 @@ def main():
             print(f"Received {size} data points")
             print(f"Data min: {np.min(data)}, max: {np.max(data)}, mean: {np.mean(data):.2f}")
             
-            # Plot the results
-            plt.figure(figsize=(10, 6))
-            plt.plot(data)
-            plt.title("Spectrum Measurement")
-            plt.xlabel("Pixel")
-            plt.ylabel("Intensity")
-            plt.grid(True)
-            
-            # Save the plot
-            plt.savefig("spectrum_measurement.png")
-            print("Saved plot to 'spectrum_measurement.png'")
-            
-            # Show the plot (uncomment if running interactively)
-            # plt.show()
+            _plot_spectrum(data)
         else:
             print("No data received from measurement")
 
@@ -107,9 +137,8 @@ def main():
         glaz.start_measurement()
         
         # Wait for the measurement to complete
-        while not glaz.is_measurement_done():
-            print("Measurement in progress...")
-            time.sleep(0.5)
+        print("Measurement in progress...")
+        glaz.wait_until_done()
         
         print("Non-blocking measurement complete")
         
@@ -123,20 +152,7 @@ def main():
             if len(all_scans) > 0:
                 print(f"All scans shape: {all_scans.shape}")
                 
-                # Plot a heatmap of all scans
-                plt.figure(figsize=(10, 6))
-                plt.imshow(all_scans, aspect='auto', interpolation='nearest')
-                plt.colorbar(label='Intensity')
-                plt.title("All Scans")
-                plt.xlabel("Pixel")
-                plt.ylabel("Scan Number")
-                
-                # Save the plot
-                plt.savefig("all_scans.png")
-                print("Saved all scans plot to 'all_scans.png'")
-                
-                # Show the plot (uncomment if running interactively)
-                # plt.show()
+                _plot_all_scans(all_scans)
         except RuntimeError as e:
             print(f"Could not retrieve all scans: {str(e)}")
 
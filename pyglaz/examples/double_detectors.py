@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Minimal example of using the PyGlaz library with a single spectrometer.
+"""
+
+import queue
+import threading
+import numpy as np
+from pyglaz import GlazLib, constants
+
+CALCULATION_INDEX = 1 # Index for calculation mode (one can change detector number here)
+
+
+def _scan_segments(pixels, scans):
+    """Pair the pixel axis with each scan, giving one (x, y) polyline per scan."""
+    return np.stack(np.broadcast_arrays(pixels, scans), axis=-1)
+
+
+class ScanStream:
+    """
+    Acquire scans on a background thread and hand them to the plotting loop.
+    
+    Frames pass through a small bounded queue. If the plot falls behind, the
+    oldest frame is dropped so the display never lags the hardware.
+    """
+
+    def __init__(self, glaz, index, max_frames=2):
+        self.error = None
+        self._glaz = glaz
+        self._index = index
+        self._frames = queue.Queue(maxsize=max_frames)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def get(self, timeout):
+        """Return the next frame, or None if none arrived within timeout seconds."""
+        try:
+            return self._frames.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                self._glaz.start_measurement()
+                while not self._glaz.is_measurement_done():
+                    if self._stop.wait(0.001):
+                        return
+                self._put(self._glaz.get_all_scans(self._index))
+        except Exception as e:
+            self.error = e
+
+    def _put(self, frame):
+        while True:
+            try:
+                self._frames.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self._glaz.release_scan_buffer(self._frames.get_nowait())
+                except queue.Empty:
+                    pass
+
+
+def main():
+    # Name of the config file; GlazLib looks it up in the configs directory
+    config_file = "double_spectrometer.xml"
+    
+    # Create a GlazLib instance
+    print("Initializing GlazLib...")
+    try:
+        # Initialize using a config file
+        glaz = GlazLib(config_file)
+
+        # Import matplotlib lazily, see pyglaz.examples
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+
+        # Print the library version
+        major, minor = glaz.get_version()
+        print(f"GlazLib version: {major}.{minor}")
+
+        #Trigger mode
+        print("Setting trigger mode...")
+        glaz.set_trigger_mode(constants.TRIGGER_EXTERNAL)
+        # glaz.set_internal_trigger_frequency(1000)  # Set frequency to 1 kHz
+        
+        # Capture 10 scans
+        print("Setting up capturing mode...")
+        glaz.set_scan_count(10)
+
+        print("Setting integration mode...")
+        glaz.set_integration_mode(constants.INT_MODE_PULSESYNC)
+        glaz.set_integration_time(100)  # Set exposure time to 10 us
+        
+        print("Run measurements...")
+        glaz.run_measurement()
+
+        # Get the result
+        print("Getting measurement results...")
+        size = glaz.get_all_scans_sizes(CALCULATION_INDEX)
+        print("Size of all scans:", size)
+        data = glaz.get_all_scans(CALCULATION_INDEX)
+        print("Data of all scans:", data)
+        
+        # Plotting the data
+        print("Plotting measurement results...")
+        wavelengths = np.arange(size[1])  # Assuming wavelengths are not provided
+        num_scans = size[0]
+
+        # Set up real-time plotting. All scans share one LineCollection, which
+        # is redrawn on its own (blitting) instead of redrawing the whole figure.
+        fig, ax = plt.subplots(figsize=(10, 6))
+        lines = LineCollection(_scan_segments(wavelengths, data), cmap='viridis', animated=True)
+        lines.set_array(np.arange(1, num_scans + 1))
+        ax.add_collection(lines)
+        ax.autoscale_view()
+        fig.colorbar(lines, ax=ax, label='Scan number')
+        
+        ax.set_xlabel('Pixel Index')
+        ax.set_ylabel('Intensity')
+        ax.set_title('Spectral Data from Multiple Scans')
+        ax.grid(True)
+        fig.tight_layout()
+        plt.ion()  # Turn on interactive mode
+        plt.show()
+
+        # Cache the static parts of the axes, and re-cache them whenever the
+        # figure is fully redrawn (e.g. after a resize)
+        background = None
+
+        def on_draw(event):
+            nonlocal background
+            background = fig.canvas.copy_from_bbox(ax.bbox)
+            ax.draw_artist(lines)
+
+        fig.canvas.mpl_connect('draw_event', on_draw)
+        fig.canvas.draw()
+        
+        # Real-time update loop. Acquisition runs on a background thread so the
+        # next measurement integrates while the current one is being drawn.
+        print("Starting real-time monitoring...")
+        stream = ScanStream(glaz, CALCULATION_INDEX)
+        stream.start()
+        try:
+            state = fig.number
+            while True:
+                data = stream.get(timeout=0.1)
+                if data is not None:
+                    # Update plot with new data
+                    lines.set_segments(_scan_segments(wavelengths, data))
+                    fig.canvas.restore_region(background)
+                    ax.draw_artist(lines)
+                    fig.canvas.blit(ax.bbox)
+                    glaz.release_scan_buffer(data)
+                fig.canvas.flush_events()
+
+                if stream.error is not None:
+                    raise stream.error
+
+                # Check if the window was closed
+                if not plt.fignum_exists(state):
+                    print("Plot window was closed")
+                    break
+            
+        except KeyboardInterrupt:
+            print("Real-time monitoring stopped by user")
+        finally:
+            stream.stop()
+
+        # Make sure to close the figure if it's still open
+        plt.close('all')
+        
+        print("Real-time monitoring ended")
+
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
+    finally:
+        # Always make sure to close the connection gracefully
+        if 'glaz' in locals():
+            print("Closing GlazLib...")
+            glaz.close()
+    
+    print("Done.")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -3,19 +3,12 @@
 Minimal example of using the PyGlaz library with a single spectrometer.
 """
 
-import os
-import sys
 import numpy as np
-import matplotlib.pyplot as plt
-from pathlib import Path
-
-# Add the parent directory to the path to be able to import pyglaz
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from pyglaz import GlazLib
 
 def main():
-    # Path to the single_spectrometer.xml config file in the configs directory
-    config_file = os.path.join(Path(__file__).parent.parent, "configs", "single_spectrometer.xml")
+    # Name of the config file; GlazLib looks it up in the configs directory
+    config_file = "single_spectrometer.xml"
     
     # Create a GlazLib instance
     print("Initializing GlazLib...")
@@ -25,6 +18,9 @@ def main():
         
         # Alternatively, initialize using device type (uncomment to use this method):
         # glaz = GlazLib(device_type=glaz.GLAZ_LINESCAN_II_V2_SINGLE_DEVICE_TYPE)
+
+        # Import matplotlib lazily, see pyglaz.examples
+        import matplotlib.pyplot as plt
         
         # Print the library version
         major, minor = glaz.get_version()
@@ -4,36 +4,41 @@ Utility functions for the pyglaz package.
 This module provides utility functions for working with Glaz configuration files.
 """
 
+from __future__ import annotations
+
+import functools
 import os
-from typing import Optional, List
+from typing import Dict, Optional, List, Sequence, Tuple
 
+# Directory listings keyed by directory path; None marks a missing directory
+_dir_listings: Dict[str, Optional[Tuple[str, ...]]] = {}
 
-def find_config_file(config_name: Optional[str] = None, search_dirs: Optional[List[str]] = None) -> str:
-    """
-    Find a configuration file by name.
-    
-    Args:
-        config_name: Name of the configuration file (with or without .xml extension).
-                     If None, it will look for either single_spectrometer.xml or 
-                     double_spectrometer.xml.
-        search_dirs: List of directories to search for the configuration file.
-                     If None, it will search in the standard locations.
-                     
-    Returns:
-        Full path to the configuration file
-        
-    Raises:
-        FileNotFoundError: If the configuration file is not found
-    """
-    if search_dirs is None:
-        # Default search locations
-        pkg_dir = os.path.dirname(os.path.abspath(__file__))
-        search_dirs = [
-            os.path.join(os.path.dirname(pkg_dir), 'configs'),  # Look in /configs directory first
-            pkg_dir,  # Look in package directory
-            os.getcwd(),  # Look in current working directory
-        ]
+
+def _default_search_dirs() -> Tuple[str, ...]:
+    """Get the standard configuration search locations."""
+    pkg_dir = os.path.dirname(os.path.abspath(__file__))
+    return (
+        os.path.join(pkg_dir, 'configs'),  # Look in bundled configs directory first
+        pkg_dir,  # Look in package directory
+        os.getcwd(),  # Look in current working directory
+    )
+
+
+def _list_dir(directory: str) -> Optional[Tuple[str, ...]]:
+    """List a directory once per process, or None if it does not exist."""
+    try:
+        return _dir_listings[directory]
+    except KeyError:
+        pass
     
+    listing = tuple(os.listdir(directory)) if os.path.isdir(directory) else None
+    _dir_listings[directory] = listing
+    return listing
+
+
+@functools.lru_cache(maxsize=32)
+def _find_config_file(config_name: Optional[str], search_dirs: Tuple[str, ...]) -> str:
+    """Cached implementation of find_config_file for hashable arguments."""
     # If config_name is None, look for default configurations
     if config_name is None:
         default_configs = ['single_spectrometer.xml', 'double_spectrometer.xml']
@@ -57,10 +62,40 @@ def find_config_file(config_name: Optional[str] = None, search_dirs: Optional[Li
     raise FileNotFoundError(f"Could not find configuration file: {config_name}")
 
 
-def list_available_configs(search_dirs: Optional[List[str]] = None) -> List[str]:
+def find_config_file(config_name: Optional[str] = None, search_dirs: Optional[Sequence[str]] = None) -> str:
+    """
+    Find a configuration file by name.
+    
+    Results are cached for the lifetime of the process; call
+    clear_config_cache() if configuration files are added or removed.
+    
+    Args:
+        config_name: Name of the configuration file (with or without .xml extension).
+                     If None, it will look for either single_spectrometer.xml or
+                     double_spectrometer.xml.
+        search_dirs: List of directories to search for the configuration file.
+                     If None, it will search in the standard locations.
+                     
+    Returns:
+        Absolute path to the configuration file
+        
+    Raises:
+        FileNotFoundError: If the configuration file is not found
+    """
+    if search_dirs is None:
+        search_dirs = _default_search_dirs()
+    # Resolve relative directories now, so the cache does not return a path
+    # found relative to a previous working directory
+    return _find_config_file(config_name, tuple(os.path.abspath(d) for d in search_dirs))
+
+
+def list_available_configs(search_dirs: Optional[Sequence[str]] = None) -> List[str]:
     """
     List all available configuration files.
     
+    Directory listings are cached for the lifetime of the process; call
+    clear_config_cache() if configuration files are added or removed.
+    
     Args:
         search_dirs: List of directories to search for configuration files.
                      If None, it will search in the standard locations.
@@ -69,19 +104,21 @@ def list_available_configs(search_dirs: Optional[List[str]] = None) -> List[str]
         List of paths to configuration files
     """
     if search_dirs is None:
-        # Default search locations
-        pkg_dir = os.path.dirname(os.path.abspath(__file__))
-        search_dirs = [
-            os.path.join(os.path.dirname(pkg_dir), 'configs'),  # Look in /configs directory first
-            pkg_dir,  # Look in package directory
-            os.getcwd(),  # Look in current working directory
-        ]
+        search_dirs = _default_search_dirs()
     
     config_files = []
     for directory in search_dirs:
-        if os.path.isdir(directory):
-            for file in os.listdir(directory):
-                if file.lower().endswith('.xml'):
-                    config_files.append(os.path.join(directory, file))
+        listing = _list_dir(directory)
+        if listing is None:
+            continue
+        for file in listing:
+            if file.lower().endswith('.xml'):
+                config_files.append(os.path.join(directory, file))
     
-    return config_files
\ No newline at end of file
+    return config_files
+
+
+def clear_config_cache() -> None:
+    """Forget all cached configuration file lookups and directory listings."""
+    _find_config_file.cache_clear()
+    _dir_listings.clear()
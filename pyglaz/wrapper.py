@@ -1,13 +1,117 @@
+from __future__ import annotations
+
 import numpy as np
 import ctypes
+import logging
 import os
+import sys
+import threading
 import time
-from ctypes import byref, c_int, c_double, c_bool, c_char_p, c_uint16, create_string_buffer, POINTER
-from typing import Tuple, List, Optional, Dict, Any, Union
+import weakref
+from types import ModuleType
+from concurrent.futures import Future, ThreadPoolExecutor
+from ctypes import byref, c_int, c_double, c_bool, c_void_p, POINTER
+from typing import Tuple, List, Optional, Dict, Any, Union, Callable, Sequence, cast
 
 from . import _bindings as lib
 from .utils import find_config_file
 
+_cffi_loader: Optional[ModuleType]
+try:
+    from . import _cffi_loader
+except (ImportError, OSError):
+    # cffi is an optional extra; fall back to the ctypes prototypes
+    _cffi_loader = None
+
+logger = logging.getLogger(__name__)
+
+# Status checks are written as "if status:", which relies on success being 0,
+# and error paths fetch the message from the bindings directly rather than
+# through GlazLib.get_last_error_message, so neither looks anything up per call
+assert lib.ERROR_NONE == 0
+_last_error_message = lib.get_last_error_message
+
+# Default USB bulk transfer size for set_usb_transfer_size
+_DEFAULT_USB_BULK_SIZE = 8192 if sys.platform in ('win32', 'darwin') else 16384
+
+
+class _Scratch(threading.local):
+    """Per-thread ctypes out-parameters, reused instead of allocated per call."""
+
+    def __init__(self):
+        self.size = c_int()
+        self.num_scans = c_int()
+        self.pixels_per_scan = c_int()
+        self.ints = (c_int(), c_int(), c_int())
+        self.flag = c_bool()
+        self.value = c_double()
+
+
+_scratch = _Scratch()
+
+# getAUXCycleCounts is only called through _ctypes_aux_cycle_counts
+_getAUXCycleCounts = lib._lib.getAUXCycleCounts
+
+
+def _ctypes_aux_cycle_counts(index: int, channel: int, counts: Optional[np.ndarray], size: int) -> Tuple[int, int]:
+    """ctypes counterpart of _cffi_loader.get_aux_cycle_counts."""
+    out_size = _scratch.size
+    out_size.value = size
+    status = _getAUXCycleCounts(index, channel, byref(out_size), counts)
+    return status, out_size.value
+
+
+# Calls with a cffi binding go through it when cffi is installed, as its call
+# overhead is lower than ctypes'
+if _cffi_loader is not None:
+    _aux_cycle_counts = _cffi_loader.get_aux_cycle_counts
+    _run_usb_comms_test = _cffi_loader.run_usb_comms_test
+else:
+    _aux_cycle_counts = _ctypes_aux_cycle_counts
+    _run_usb_comms_test = lib._lib.runUSBCommsTest
+
+
+def _to_complex(parts: np.ndarray) -> np.ndarray:
+    """Interleave a (2, N) block of real and imaginary rows into complex128."""
+    data = np.empty(parts.shape[1], dtype=np.complex128)
+    data.real = parts[0]
+    data.imag = parts[1]
+    return data
+
+
+# The library holds one session per process, so state derived from it is kept
+# here and shared by every GlazLib instance rather than held per instance.
+
+# Result sizes by (kind, index, channel), valid until the next measurement or
+# geometry change
+_size_cache: Dict[Tuple[str, int, int], Any] = {}
+
+# Bumped whenever the scan geometry may have changed, so closures from
+# compile_fast_get_all_scans can tell that their buffer is stale
+_geometry_epoch = 0
+
+# Scan buffers handed back through release_scan_buffer, by shape. Only a few
+# are kept per shape, enough for a consumer that holds one while the next is
+# filled.
+_idle_scan_buffers: Dict[Tuple[int, int], List[np.ndarray]] = {}
+_MAX_IDLE_SCAN_BUFFERS = 2
+
+
+def _geometry_changed() -> None:
+    """Mark every buffer sized for the current scan geometry as stale."""
+    global _geometry_epoch
+    _geometry_epoch += 1
+    # Pooled buffers of the old shape would never be handed out again
+    _idle_scan_buffers.clear()
+
+
+def _close_session(close_session) -> None:
+    """Finalizer for sessions that were never closed explicitly; never raises."""
+    try:
+        close_session()
+    except Exception:
+        pass
+
 
 class GlazLib:
     """
@@ -16,8 +120,11 @@ class GlazLib:
     This class provides a Pythonic interface to the GlazLib spectroscopic library.
     """
     
+    # Library handle, bound on the class so calls skip the _bindings module lookup
+    _lib = lib._lib
+    
     def __init__(self, config_file: Optional[str] = None, device_type: int = lib.GLAZ_LINESCAN_II_V2_SINGLE_DEVICE_TYPE, 
-                 use_defaults: bool = True, allow_demo: bool = True):
+                 use_defaults: bool = True, allow_demo: bool = True, usb_bulk_size: Optional[int] = None):
         """
         Initialize the GlazLib session.
         
@@ -27,12 +134,34 @@ class GlazLib:
             device_type: Type of device to initialize if config_file is None and no default config is found
             use_defaults: Whether to use default settings when initializing with device_type
             allow_demo: Whether to allow demo mode if no device is connected
+            usb_bulk_size: USB bulk transfer size in bytes to apply before the session
+                           is opened, see set_usb_transfer_size. None leaves the
+                           library's setting unchanged.
             
         Raises:
             RuntimeError: If initialization fails
             FileNotFoundError: If the specified config file is not found
         """
         self._initialized = False
+        self._finalizer: Optional[weakref.finalize] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Library functions called on the acquisition path, bound onto the
+        # instance so a call is one attribute lookup instead of two
+        self._runMeasurement = self._lib.runMeasurement
+        self._startMeasurement = self._lib.startMeasurement
+        self._isMeasurementDone = self._lib.isMeasurementDone
+        self._getResult = self._lib.getResult
+        self._getComplexResult = self._lib.getComplexResult
+        self._getTimeStamp = self._lib.getTimeStamp
+        self._getScan = self._lib.getScan
+        self._getComplexScan = self._lib.getComplexScan
+        self._getAllScansSizes = self._lib.getAllScansSizes
+        self._getAllScans = self._lib.getAllScans
+        self._getPDValues = self._lib.getPDValues
+        self._getPDReference = self._lib.getPDReference
+        self._getAUXStates = self._lib.getAUXStates
+        # Set by start_measurement until is_measurement_done sees completion
+        self._measurement_running = False
         
         try:
             # Try to find a config file first
@@ -51,22 +180,15 @@ class GlazLib:
                     # No config file found, will use device_type instead
                     config_path = None
             
-            # Initialize with config file if found
+            # Resolve and encode the session arguments once, so the session can
+            # be reopened without searching for the config file again
+            self._config_path_bytes = None
             if config_path is not None:
-                print(f"Initializing with configuration file: {config_path}")
-                status = lib._lib.initialiseSession(c_char_p(config_path.encode('utf-8')))
-                if status != lib.ERROR_NONE:
-                    error_msg = self.get_last_error_message()
-                    raise RuntimeError(f"Failed to initialize GlazLib session with config file: {error_msg}")
-            else:
-                # Fall back to device type initialization
-                print(f"No configuration file found. Initializing device type: {device_type}")
-                status = lib._lib.initialiseSingleDeviceSession(device_type, use_defaults, allow_demo)
-                if status != lib.ERROR_NONE:
-                    error_msg = self.get_last_error_message()
-                    raise RuntimeError(f"Failed to initialize GlazLib session with device type: {error_msg}")
-            
-            self._initialized = True
+                self._config_path_bytes = os.fsencode(os.path.abspath(config_path))
+            self._device_args = (device_type, use_defaults, allow_demo)
+            if usb_bulk_size is not None:
+                self.set_usb_transfer_size(usb_bulk_size)
+            self._open_session()
         
         except Exception as e:
             if isinstance(e, RuntimeError):
@@ -76,9 +198,44 @@ class GlazLib:
             else:
                 raise RuntimeError(f"Failed to initialize GlazLib session: {str(e)}")
     
-    def __del__(self):
-        """Clean up resources when object is destroyed."""
+    def _open_session(self) -> None:
+        """Initialize the session from the stored config file or device type."""
+        if self._config_path_bytes is not None:
+            logger.info("Initializing with configuration file: %s", os.fsdecode(self._config_path_bytes))
+            status = self._lib.initialiseSession(self._config_path_bytes)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to initialize GlazLib session with config file: {error_msg}")
+        else:
+            # Fall back to device type initialization
+            logger.info("No configuration file found. Initializing device type: %s", self._device_args[0])
+            status = self._lib.initialiseSingleDeviceSession(*self._device_args)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to initialize GlazLib session with device type: {error_msg}")
+        
+        self._initialized = True
+        self._measurement_running = False
+        # Close the session when this object is collected or at interpreter
+        # exit; the finalizer holds no reference to self and does no I/O
+        self._finalizer = weakref.finalize(self, _close_session, self._lib.closeSession)
+        _geometry_changed()
+        self.invalidate_size_cache()
+        # Values applied through the setters since the session was opened
+        self._settings: Dict[str, Any] = {}
+    
+    def reinitialise(self) -> None:
+        """
+        Close the session and open it again with the original arguments.
+        
+        The configuration file is not searched for again; the path resolved
+        when this object was created is reused.
+        
+        Raises:
+            RuntimeError: If closing or initializing the session fails
+        """
         self.close()
+        self._open_session()
     
     def close(self):
         """
@@ -90,26 +247,34 @@ class GlazLib:
         Raises:
             RuntimeError: If closing the session fails with a critical error
         """
+        if self._executor is not None:
+            # Let a measurement started by run_measurement_threaded finish first
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
         if not self._initialized:
             return
             
-        print("Closing GlazLib session...")
+        logger.debug("Closing GlazLib session...")
+        if self._finalizer is not None:
+            # Closed explicitly, so the finalizer must not close it again
+            self._finalizer.detach()
+            self._finalizer = None
         try:
             # Attempt to close the session
-            status = lib._lib.closeSession()
-            print("Here")
+            status = self._lib.closeSession()
             self._initialized = False
             
             # Check if closing was successful
-            if status != lib.ERROR_NONE:
-                error_msg = self.get_last_error_message()
-                print(f"Warning: GlazLib session close returned error code {status}: {error_msg}")
+            if status:
+                error_msg = _last_error_message()
+                logger.warning("GlazLib session close returned error code %s: %s", status, error_msg)
                 
                 # Only raise exception for critical errors
                 if status not in [lib.ERROR_NOT_INITIALISED]:  # Add other non-critical errors if needed
                     raise RuntimeError(f"Failed to close GlazLib session: {error_msg}")
         except Exception as e:
-            print(f"Exception during GlazLib session close: {str(e)}")
+            logger.warning("Exception during GlazLib session close: %s", e)
             # Set initialized to False anyway to prevent further access attempts
             self._initialized = False
             
@@ -124,9 +289,8 @@ class GlazLib:
         Returns:
             Tuple containing (major_version, minor_version)
         """
-        major = c_int()
-        minor = c_int()
-        lib._lib.getVersion(byref(major), byref(minor))
+        major, minor = _scratch.ints[0], _scratch.ints[1]
+        self._lib.getVersion(byref(major), byref(minor))
         return (major.value, minor.value)
     
     def get_last_error_message(self) -> str:
@@ -136,10 +300,7 @@ class GlazLib:
         Returns:
             String containing the last error message
         """
-        buffer_size = 1024
-        buffer = create_string_buffer(buffer_size)
-        lib._lib.getLastErrorMessage(buffer)
-        return buffer.value.decode('utf-8')
+        return lib.get_last_error_message()
     
     def get_usb_parameters(self) -> Dict[str, int]:
         """
@@ -148,10 +309,8 @@ class GlazLib:
         Returns:
             Dictionary with keys 'timeout', 'bulk_size', and 'queue_size'
         """
-        timeout = c_int()
-        bulk_size = c_int()
-        queue_size = c_int()
-        lib._lib.getUSBParameters(byref(timeout), byref(bulk_size), byref(queue_size))
+        timeout, bulk_size, queue_size = _scratch.ints
+        self._lib.getUSBParameters(byref(timeout), byref(bulk_size), byref(queue_size))
         return {
             'timeout': timeout.value,
             'bulk_size': bulk_size.value,
@@ -166,14 +325,28 @@ class GlazLib:
             timeout: USB timeout in milliseconds
             bulk_size: Size of bulk transfers
             queue_size: Size of the queue
-            
-        Raises:
-            RuntimeError: If setting the parameters fails
         """
-        status = lib._lib.setUSBParameters(timeout, bulk_size, queue_size)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set USB parameters: {error_msg}")
+        # setUSBParameters returns void, so there is no status to check
+        self._lib.setUSBParameters(timeout, bulk_size, queue_size)
+    
+    def set_usb_transfer_size(self, bulk_size: Optional[int] = None) -> None:
+        """
+        Set the USB bulk transfer size, keeping the other USB parameters.
+        
+        On Windows and macOS, 8 KB transfers usually sustain higher throughput
+        than 16 KB ones, because the retry window after a NAK is shorter; on
+        Linux the larger size works well. run_usb_comms_test can be used to
+        exercise the link after a change; it raises RuntimeError if the
+        library reports a non-zero status.
+        
+        Args:
+            bulk_size: Bulk transfer size in bytes, or None for the platform
+                       default (8192 on Windows and macOS, 16384 elsewhere)
+        """
+        if bulk_size is None:
+            bulk_size = _DEFAULT_USB_BULK_SIZE
+        params = self.get_usb_parameters()
+        self.set_usb_parameters(params['timeout'], bulk_size, params['queue_size'])
     
     def enable_data_stream_log(self, enable: bool) -> None:
         """
@@ -182,15 +355,29 @@ class GlazLib:
         Args:
             enable: True to enable logging, False to disable
         """
-        lib._lib.enableDataStreamLog(enable)
+        self._lib.enableDataStreamLog(enable)
     
     def reset_all_devices(self) -> None:
         """Reset all connected devices."""
-        lib._lib.resetAllDevices()
+        self._lib.resetAllDevices()
+        self._forget_device_state()
     
     def reset_all_ports(self) -> None:
         """Reset all USB ports."""
-        lib._lib.resetAllPorts()
+        self._lib.resetAllPorts()
+        self._forget_device_state()
+    
+    def _forget_device_state(self) -> None:
+        """
+        Drop everything remembered about the device after a reset.
+        
+        The hardware may have lost its settings and scan geometry, so configure
+        must apply every setting again, result sizes must be queried again, and
+        closures from compile_fast_get_all_scans become stale.
+        """
+        self._settings.clear()
+        _geometry_changed()
+        self.invalidate_size_cache()
     
     def set_test_mode(self, mode: int) -> None:
         """
@@ -202,10 +389,7 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the test mode fails
         """
-        status = lib._lib.setTestMode(mode)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set test mode: {error_msg}")
+        self._lib.setTestMode(mode)
     
     def set_wavelengths(self, min_wavelength: float, max_wavelength: float) -> None:
         """
@@ -218,10 +402,10 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the wavelength range fails
         """
-        status = lib._lib.setWavelengths(c_double(min_wavelength), c_double(max_wavelength))
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set wavelength range: {error_msg}")
+        _geometry_changed()
+        self.invalidate_size_cache()
+        self._lib.setWavelengths(min_wavelength, max_wavelength)
+        self._settings['wavelengths'] = (min_wavelength, max_wavelength)
     
     def set_hardware_averaging(self, averaging: int) -> None:
         """
@@ -233,10 +417,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the hardware averaging fails
         """
-        status = lib._lib.setHardwareAveraging(averaging)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set hardware averaging: {error_msg}")
+        self._lib.setHardwareAveraging(averaging)
+        self._settings['hardware_averaging'] = averaging
     
     def set_resolution(self, resolution: int) -> None:
         """
@@ -248,10 +430,10 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the resolution fails
         """
-        status = lib._lib.setResolution(resolution)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set resolution: {error_msg}")
+        _geometry_changed()
+        self.invalidate_size_cache()
+        self._lib.setResolution(resolution)
+        self._settings['resolution'] = resolution
     
     def set_scan_count(self, count: int) -> None:
         """
@@ -263,10 +445,10 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the scan count fails
         """
-        status = lib._lib.setScanCount(count)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set scan count: {error_msg}")
+        _geometry_changed()
+        self.invalidate_size_cache()
+        self._lib.setScanCount(count)
+        self._settings['scan_count'] = count
     
     def set_scan_clock_speed(self, speed: int) -> None:
         """
@@ -278,10 +460,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the scan clock speed fails
         """
-        status = lib._lib.setScanClockSpeed(speed)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set scan clock speed: {error_msg}")
+        self._lib.setScanClockSpeed(speed)
+        self._settings['scan_clock_speed'] = speed
     
     def set_adc_gain(self, gain: int) -> None:
         """
@@ -293,10 +473,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the ADC gain fails
         """
-        status = lib._lib.setADCGain(gain)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set ADC gain: {error_msg}")
+        self._lib.setADCGain(gain)
+        self._settings['adc_gain'] = gain
     
     def set_trigger_delay(self, delay: int) -> None:
         """
@@ -308,10 +486,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the trigger delay fails
         """
-        status = lib._lib.setTriggerDelay(delay)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set trigger delay: {error_msg}")
+        self._lib.setTriggerDelay(delay)
+        self._settings['trigger_delay'] = delay
     
     def set_trigger_mode(self, mode: int) -> None:
         """
@@ -323,10 +499,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the trigger mode fails
         """
-        status = lib._lib.setTriggerMode(mode)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set trigger mode: {error_msg}")
+        self._lib.setTriggerMode(mode)
+        self._settings['trigger_mode'] = mode
     
     def set_internal_trigger_frequency(self, frequency: float) -> None:
         """
@@ -338,10 +512,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the internal trigger frequency fails
         """
-        status = lib._lib.setInternalTriggerFrequency(c_double(frequency))
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set internal trigger frequency: {error_msg}")
+        self._lib.setInternalTriggerFrequency(frequency)
+        self._settings['internal_trigger_frequency'] = frequency
     
     def set_integration_mode(self, mode: int) -> None:
         """
@@ -353,10 +525,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the integration mode fails
         """
-        status = lib._lib.setIntegrationMode(mode)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set integration mode: {error_msg}")
+        self._lib.setIntegrationMode(mode)
+        self._settings['integration_mode'] = mode
     
     def set_integration_time(self, time: int) -> None:
         """
@@ -368,10 +538,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the integration time fails
         """
-        status = lib._lib.setIntegrationTime(time)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set integration time: {error_msg}")
+        self._lib.setIntegrationTime(time)
+        self._settings['integration_time'] = time
     
     def set_sync_out_mode(self, mode: int) -> None:
         """
@@ -383,10 +551,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the sync output mode fails
         """
-        status = lib._lib.setSyncOutMode(mode)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set sync output mode: {error_msg}")
+        self._lib.setSyncOutMode(mode)
+        self._settings['sync_out_mode'] = mode
     
     def set_sync_out_polarity(self, polarity: int) -> None:
         """
@@ -398,10 +564,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the sync output polarity fails
         """
-        status = lib._lib.setSyncOutPolarity(polarity)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set sync output polarity: {error_msg}")
+        self._lib.setSyncOutPolarity(polarity)
+        self._settings['sync_out_polarity'] = polarity
     
     def set_aux_out_mode(self, mode: int) -> None:
         """
@@ -413,10 +577,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the auxiliary output mode fails
         """
-        status = lib._lib.setAuxOutMode(mode)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set auxiliary output mode: {error_msg}")
+        self._lib.setAuxOutMode(mode)
+        self._settings['aux_out_mode'] = mode
     
     def set_aux_out_polarity(self, polarity: int) -> None:
         """
@@ -428,10 +590,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the auxiliary output polarity fails
         """
-        status = lib._lib.setAuxOutPolarity(polarity)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set auxiliary output polarity: {error_msg}")
+        self._lib.setAuxOutPolarity(polarity)
+        self._settings['aux_out_polarity'] = polarity
     
     def set_out_cycle_count(self, count: int) -> None:
         """
@@ -443,10 +603,8 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the output cycle count fails
         """
-        status = lib._lib.setOutCycleCount(count)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set output cycle count: {error_msg}")
+        self._lib.setOutCycleCount(count)
+        self._settings['out_cycle_count'] = count
     
     def set_timeout(self, timeout: int) -> None:
         """
@@ -458,10 +616,92 @@ class GlazLib:
         Raises:
             RuntimeError: If setting the timeout fails
         """
-        status = lib._lib.setTimeout(timeout)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to set timeout: {error_msg}")
+        self._lib.setTimeout(timeout)
+        self._settings['timeout'] = timeout
+    
+    def configure(self, *, wavelengths: Optional[Tuple[float, float]] = None,
+                  hardware_averaging: Optional[int] = None, resolution: Optional[int] = None,
+                  scan_count: Optional[int] = None, scan_clock_speed: Optional[int] = None,
+                  adc_gain: Optional[int] = None, trigger_delay: Optional[int] = None,
+                  trigger_mode: Optional[int] = None, internal_trigger_frequency: Optional[float] = None,
+                  integration_mode: Optional[int] = None, integration_time: Optional[int] = None,
+                  sync_out_mode: Optional[int] = None, sync_out_polarity: Optional[int] = None,
+                  aux_out_mode: Optional[int] = None, aux_out_polarity: Optional[int] = None,
+                  out_cycle_count: Optional[int] = None, timeout: Optional[int] = None) -> None:
+        """
+        Apply several device settings in one call.
+        
+        Only the settings that are given are applied, in the order of the
+        arguments. A setting that already holds the requested value (as last
+        applied through this object's setters) is skipped, so calling configure
+        with unchanged arguments, e.g. inside a parameter sweep, only pays for the
+        settings that actually change.
+        
+        Args:
+            wavelengths: (min_wavelength, max_wavelength) in nm
+            hardware_averaging: Hardware averaging factor, see set_hardware_averaging
+            resolution: Resolution, see set_resolution
+            scan_count: Number of scans to perform
+            scan_clock_speed: Scan clock speed, see set_scan_clock_speed
+            adc_gain: ADC gain, see set_adc_gain
+            trigger_delay: Trigger delay in microseconds
+            trigger_mode: Trigger mode, see set_trigger_mode
+            internal_trigger_frequency: Internal trigger frequency in Hz
+            integration_mode: Integration mode, see set_integration_mode
+            integration_time: Integration time in microseconds
+            sync_out_mode: Sync output mode, see set_sync_out_mode
+            sync_out_polarity: Sync output polarity, see set_sync_out_polarity
+            aux_out_mode: Auxiliary output mode, see set_aux_out_mode
+            aux_out_polarity: Auxiliary output polarity, see set_aux_out_polarity
+            out_cycle_count: Number of output cycles
+            timeout: Operation timeout in milliseconds
+            
+        Raises:
+            RuntimeError: If applying a setting fails. Settings before the failing
+                          one remain applied.
+        """
+        if wavelengths is not None:
+            # Normalise to the tuple form the settings cache holds, so a list
+            # of the same values is recognised as unchanged
+            wavelengths = (wavelengths[0], wavelengths[1])
+        # Values of different types share the table, so the setters take Any
+        requested: Tuple[Tuple[str, Any, Callable[[Any], None]], ...] = (
+            ('wavelengths', wavelengths, lambda value: self.set_wavelengths(*value)),
+            ('hardware_averaging', hardware_averaging, self.set_hardware_averaging),
+            ('resolution', resolution, self.set_resolution),
+            ('scan_count', scan_count, self.set_scan_count),
+            ('scan_clock_speed', scan_clock_speed, self.set_scan_clock_speed),
+            ('adc_gain', adc_gain, self.set_adc_gain),
+            ('trigger_delay', trigger_delay, self.set_trigger_delay),
+            ('trigger_mode', trigger_mode, self.set_trigger_mode),
+            ('internal_trigger_frequency', internal_trigger_frequency, self.set_internal_trigger_frequency),
+            ('integration_mode', integration_mode, self.set_integration_mode),
+            ('integration_time', integration_time, self.set_integration_time),
+            ('sync_out_mode', sync_out_mode, self.set_sync_out_mode),
+            ('sync_out_polarity', sync_out_polarity, self.set_sync_out_polarity),
+            ('aux_out_mode', aux_out_mode, self.set_aux_out_mode),
+            ('aux_out_polarity', aux_out_polarity, self.set_aux_out_polarity),
+            ('out_cycle_count', out_cycle_count, self.set_out_cycle_count),
+            ('timeout', timeout, self.set_timeout),
+        )
+        for name, value, setter in requested:
+            if value is None:
+                continue
+            if self._settings.get(name) == value:
+                continue
+            setter(value)
+    
+    def invalidate_size_cache(self) -> None:
+        """
+        Forget the cached result sizes.
+        
+        The getters remember result sizes so they can skip the size query call.
+        The cache is cleared automatically by measurements, background capture
+        and settings that change the scan geometry; call this after changing the
+        geometry by other means. The cache is shared by all GlazLib instances,
+        like the library session it describes.
+        """
+        _size_cache.clear()
     
     def capture_background(self, count: int = 1) -> None:
         """
@@ -473,9 +713,10 @@ class GlazLib:
         Raises:
             RuntimeError: If capturing the background fails
         """
-        status = lib._lib.captureBackground(count)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        self.invalidate_size_cache()
+        status = self._lib.captureBackground(count)
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to capture background: {error_msg}")
     
     def run_measurement(self) -> None:
@@ -485,11 +726,33 @@ class GlazLib:
         Raises:
             RuntimeError: If running the measurement fails
         """
-        status = lib._lib.runMeasurement()
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        self.invalidate_size_cache()
+        try:
+            status = self._runMeasurement()
+        finally:
+            # Getters on other threads may have cached sizes of the previous
+            # result while the measurement ran
+            self.invalidate_size_cache()
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to run measurement: {error_msg}")
     
+    def run_measurement_threaded(self) -> Future:
+        """
+        Run a blocking measurement on a background thread.
+        
+        The library is loaded with ctypes.CDLL, which releases the GIL for the
+        duration of each call, so other Python threads keep running while the
+        measurement is in progress.
+        
+        Returns:
+            Future that completes when the measurement has finished. Its result()
+            re-raises the RuntimeError from run_measurement if the measurement fails.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pyglaz')
+        return self._executor.submit(self.run_measurement)
+    
     def start_measurement(self) -> None:
         """
         Start a measurement (non-blocking).
@@ -497,27 +760,73 @@ class GlazLib:
         Raises:
             RuntimeError: If starting the measurement fails
         """
-        status = lib._lib.startMeasurement()
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        self.invalidate_size_cache()
+        status = self._startMeasurement()
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to start measurement: {error_msg}")
+        self._measurement_running = True
     
     def is_measurement_done(self) -> bool:
         """
         Check if a non-blocking measurement is complete.
         
+        Avoid calling this in a tight loop such as
+        ``while not glaz.is_measurement_done(): pass``, which keeps a CPU core
+        busy with library calls for the whole measurement; use wait_until_done
+        instead.
+        
         Returns:
             True if the measurement is complete, False otherwise
             
         Raises:
             RuntimeError: If checking the measurement status fails
         """
-        done = c_bool()
-        status = lib._lib.isMeasurementDone(byref(done))
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        done = _scratch.flag
+        status = self._isMeasurementDone(byref(done))
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to check if measurement is done: {error_msg}")
-        return done.value
+        if done.value and self._measurement_running:
+            # Sizes cached while the measurement ran may describe the previous result
+            self._measurement_running = False
+            self.invalidate_size_cache()
+        return bool(done.value)
+    
+    def wait_until_done(self, timeout: Optional[float] = None, poll_hint_ms: float = 1,
+                        max_poll_ms: float = 50) -> bool:
+        """
+        Wait for a non-blocking measurement to complete.
+        
+        The completion flag is polled with an exponential backoff that starts at
+        poll_hint_ms and is capped at max_poll_ms, so short measurements are
+        picked up quickly without polling long ones at a high rate. For latency
+        sensitive loops, a small start and cap such as poll_hint_ms=0.01 and
+        max_poll_ms=1 still leave the CPU nearly idle.
+        
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+            poll_hint_ms: Initial polling interval in milliseconds
+            max_poll_ms: Longest polling interval in milliseconds
+            
+        Returns:
+            True if the measurement completed, False if the timeout expired
+            
+        Raises:
+            RuntimeError: If checking the measurement status fails
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        sleep_s = poll_hint_ms / 1000.0
+        max_sleep_s = max_poll_ms / 1000.0
+        while not self.is_measurement_done():
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                sleep_s = min(sleep_s, remaining)
+            time.sleep(sleep_s)
+            sleep_s = min(sleep_s * 2, max_sleep_s)
+        return True
     
     def get_result(self, index: int = 0) -> Tuple[np.ndarray, int]:
         """
@@ -532,22 +841,28 @@ class GlazLib:
         Raises:
             RuntimeError: If getting the result fails
         """
-        size = c_int()
-        status = lib._lib.getResult(index, byref(size), None)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to get result size: {error_msg}")
+        size = _scratch.size
+        key = ('result', index, 0)
+        cached = _size_cache.get(key)
+        if cached is None:
+            status = self._getResult(index, byref(size), None)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to get result size: {error_msg}")
+            _size_cache[key] = size.value
+        else:
+            size.value = cached
         
         if size.value <= 0:
             return np.array([]), 0
         
-        data = (c_double * size.value)()
-        status = lib._lib.getResult(index, byref(size), data)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        data = np.empty(size.value, dtype=np.float64)
+        status = self._getResult(index, byref(size), data)
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to get result data: {error_msg}")
         
-        return np.array([data[i] for i in range(size.value)]), size.value
+        return data, size.value
     
     def get_complex_result(self, index: int = 0) -> Tuple[np.ndarray, np.ndarray, int]:
         """
@@ -562,25 +877,69 @@ class GlazLib:
         Raises:
             RuntimeError: If getting the complex result fails
         """
-        size = c_int()
-        status = lib._lib.getComplexResult(index, byref(size), None, None)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to get complex result size: {error_msg}")
+        size = _scratch.size
+        key = ('complex_result', index, 0)
+        cached = _size_cache.get(key)
+        if cached is None:
+            status = self._getComplexResult(index, byref(size), None, None)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to get complex result size: {error_msg}")
+            _size_cache[key] = size.value
+        else:
+            size.value = cached
         
         if size.value <= 0:
             return np.array([]), np.array([]), 0
         
-        real_data = (c_double * size.value)()
-        imag_data = (c_double * size.value)()
-        status = lib._lib.getComplexResult(index, byref(size), real_data, imag_data)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        real_data = np.empty(size.value, dtype=np.float64)
+        imag_data = np.empty(size.value, dtype=np.float64)
+        status = self._getComplexResult(index, byref(size), real_data, imag_data)
+        if status:
+            error_msg = _last_error_message()
+            raise RuntimeError(f"Failed to get complex result data: {error_msg}")
+        
+        return real_data, imag_data, size.value
+    
+    def get_complex_result_array(self, index: int = 0) -> Tuple[np.ndarray, int]:
+        """
+        Get a complex measurement result as a single complex array.
+        
+        The library writes real and imaginary parts to separate buffers, so
+        both are filled into one block and interleaved into a complex128
+        array in a single pass.
+        
+        Args:
+            index: Result index
+            
+        Returns:
+            Tuple containing (data, size)
+            
+        Raises:
+            RuntimeError: If getting the complex result fails
+        """
+        size = _scratch.size
+        key = ('complex_result', index, 0)
+        cached = _size_cache.get(key)
+        if cached is None:
+            status = self._getComplexResult(index, byref(size), None, None)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to get complex result size: {error_msg}")
+            _size_cache[key] = size.value
+        else:
+            size.value = cached
+        
+        if size.value <= 0:
+            return np.array([], dtype=np.complex128), 0
+        
+        parts = np.empty((2, size.value), dtype=np.float64)
+        status = self._getComplexResult(index, byref(size), parts[0], parts[1])
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to get complex result data: {error_msg}")
         
-        real_arr = np.array([real_data[i] for i in range(size.value)])
-        imag_arr = np.array([imag_data[i] for i in range(size.value)])
-        return real_arr, imag_arr, size.value
+        return _to_complex(parts), size.value
     
     def get_time_stamp(self, index: int = 0, channel: int = 0) -> float:
         """
@@ -596,12 +955,12 @@ class GlazLib:
         Raises:
             RuntimeError: If getting the time stamp fails
         """
-        value = c_double()
-        status = lib._lib.getTimeStamp(index, channel, byref(value))
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        value = _scratch.value
+        status = self._getTimeStamp(index, channel, byref(value))
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to get time stamp: {error_msg}")
-        return value.value
+        return float(value.value)
     
     def get_scan(self, index: int = 0, scan_index: int = 0) -> Tuple[np.ndarray, int]:
         """
@@ -617,22 +976,28 @@ class GlazLib:
         Raises:
             RuntimeError: If getting the scan fails
         """
-        size = c_int()
-        status = lib._lib.getScan(index, scan_index, byref(size), None)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to get scan size: {error_msg}")
+        size = _scratch.size
+        key = ('scan', index, scan_index)
+        cached = _size_cache.get(key)
+        if cached is None:
+            status = self._getScan(index, scan_index, byref(size), None)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to get scan size: {error_msg}")
+            _size_cache[key] = size.value
+        else:
+            size.value = cached
         
         if size.value <= 0:
             return np.array([]), 0
         
-        data = (c_double * size.value)()
-        status = lib._lib.getScan(index, scan_index, byref(size), data)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        data = np.empty(size.value, dtype=np.float64)
+        status = self._getScan(index, scan_index, byref(size), data)
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to get scan data: {error_msg}")
         
-        return np.array([data[i] for i in range(size.value)]), size.value
+        return data, size.value
     
     def get_complex_scan(self, index: int = 0, scan_index: int = 0) -> Tuple[np.ndarray, np.ndarray, int]:
         """
@@ -648,25 +1013,66 @@ class GlazLib:
         Raises:
             RuntimeError: If getting the complex scan fails
         """
-        size = c_int()
-        status = lib._lib.getComplexScan(index, scan_index, byref(size), None, None)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to get complex scan size: {error_msg}")
+        size = _scratch.size
+        key = ('complex_scan', index, scan_index)
+        cached = _size_cache.get(key)
+        if cached is None:
+            status = self._getComplexScan(index, scan_index, byref(size), None, None)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to get complex scan size: {error_msg}")
+            _size_cache[key] = size.value
+        else:
+            size.value = cached
         
         if size.value <= 0:
             return np.array([]), np.array([]), 0
         
-        real_data = (c_double * size.value)()
-        imag_data = (c_double * size.value)()
-        status = lib._lib.getComplexScan(index, scan_index, byref(size), real_data, imag_data)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        real_data = np.empty(size.value, dtype=np.float64)
+        imag_data = np.empty(size.value, dtype=np.float64)
+        status = self._getComplexScan(index, scan_index, byref(size), real_data, imag_data)
+        if status:
+            error_msg = _last_error_message()
+            raise RuntimeError(f"Failed to get complex scan data: {error_msg}")
+        
+        return real_data, imag_data, size.value
+    
+    def get_complex_scan_array(self, index: int = 0, scan_index: int = 0) -> Tuple[np.ndarray, int]:
+        """
+        Get a complex scan as a single complex array.
+        
+        Args:
+            index: Result index
+            scan_index: Scan index
+            
+        Returns:
+            Tuple containing (data, size)
+            
+        Raises:
+            RuntimeError: If getting the complex scan fails
+        """
+        size = _scratch.size
+        key = ('complex_scan', index, scan_index)
+        cached = _size_cache.get(key)
+        if cached is None:
+            status = self._getComplexScan(index, scan_index, byref(size), None, None)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to get complex scan size: {error_msg}")
+            _size_cache[key] = size.value
+        else:
+            size.value = cached
+        
+        if size.value <= 0:
+            return np.array([], dtype=np.complex128), 0
+        
+        parts = np.empty((2, size.value), dtype=np.float64)
+        status = self._getComplexScan(index, scan_index, byref(size), parts[0], parts[1])
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to get complex scan data: {error_msg}")
         
-        real_arr = np.array([real_data[i] for i in range(size.value)])
-        imag_arr = np.array([imag_data[i] for i in range(size.value)])
-        return real_arr, imag_arr, size.value
+        return _to_complex(parts), size.value
     
     def get_all_scans_sizes(self, index: int = 0) -> Tuple[int, int]:
         """
@@ -681,23 +1087,34 @@ class GlazLib:
         Raises:
             RuntimeError: If getting the scan sizes fails
         """
-        num_scans = c_int()
-        pixels_per_scan = c_int()
-        status = lib._lib.getAllScansSizes(index, byref(num_scans), byref(pixels_per_scan))
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        key = ('all_scans', index, 0)
+        cached: Optional[Tuple[int, int]] = _size_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        num_scans = _scratch.num_scans
+        pixels_per_scan = _scratch.pixels_per_scan
+        status = self._getAllScansSizes(index, byref(num_scans), byref(pixels_per_scan))
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to get all scans sizes: {error_msg}")
-        return num_scans.value, pixels_per_scan.value
+        sizes = (num_scans.value, pixels_per_scan.value)
+        _size_cache[key] = sizes
+        return sizes
     
     def get_all_scans(self, index: int = 0) -> np.ndarray:
         """
         Get all scans for a result.
         
+        The library writes directly into the returned array. Pass it to
+        release_scan_buffer once done with it, and a later call with the same
+        shape will fill it again instead of allocating a new array.
+        
         Args:
             index: Result index
             
         Returns:
-            2D array of scan data
+            2D uint16 array of scan data
             
         Raises:
             RuntimeError: If getting all scans fails
@@ -706,16 +1123,132 @@ class GlazLib:
         if num_scans <= 0 or pixels_per_scan <= 0:
             return np.array([])
         
-        total_size = num_scans * pixels_per_scan
-        data = (c_uint16 * total_size)()
-        status = lib._lib.getAllScans(index, data)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        shape = (num_scans, pixels_per_scan)
+        try:
+            data = _idle_scan_buffers[shape].pop()
+        except (KeyError, IndexError):
+            data = np.empty(shape, dtype=np.uint16)
+        status = self._getAllScans(index, data)
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to get all scans: {error_msg}")
         
-        # Convert to numpy array and reshape
-        array_data = np.array([data[i] for i in range(total_size)], dtype=np.uint16)
-        return array_data.reshape((num_scans, pixels_per_scan))
+        return data
+    
+    def release_scan_buffer(self, data: np.ndarray) -> None:
+        """
+        Hand an array returned by get_all_scans back for reuse.
+        
+        The next get_all_scans call with the same shape may overwrite it, so the
+        caller must not use the array after releasing it. Empty arrays, as
+        returned by get_all_scans when there are no scans, are ignored. At most
+        two buffers are kept per shape, further ones are left to the garbage
+        collector, and all are dropped when the scan geometry changes.
+        
+        Args:
+            data: Array previously returned by get_all_scans
+            
+        Raises:
+            ValueError: If data is not a buffer get_all_scans could have
+                        allocated: a writeable, C-contiguous 2D uint16 array
+                        that owns its memory. Views, memory maps and the buffer
+                        of compile_fast_get_all_scans are rejected.
+        """
+        if data.size == 0:
+            return
+        if (data.ndim != 2 or data.dtype != np.uint16 or data.base is not None
+                or not data.flags.c_contiguous or not data.flags.writeable):
+            raise ValueError("Only arrays returned by get_all_scans can be released for reuse")
+        idle = _idle_scan_buffers.setdefault(data.shape, [])
+        if len(idle) < _MAX_IDLE_SCAN_BUFFERS and not any(buffer is data for buffer in idle):
+            idle.append(data)
+    
+    def compile_fast_get_all_scans(self, index: int = 0) -> Callable[[], np.ndarray]:
+        """
+        Build a function that fetches all scans into one fixed buffer.
+        
+        For acquisitions that repeat with the same scan count, resolution and
+        wavelength range, the returned function skips the size query, the
+        buffer lookup and the argument conversion done by get_all_scans: each
+        call is a single library call that fills the same preallocated array
+        and returns it. The array is overwritten by the next call, so copy it
+        if it must be kept, and do not pass it to release_scan_buffer.
+        
+        The function raises RuntimeError once the scan geometry has been
+        changed through set_scan_count, set_resolution, set_wavelengths,
+        reinitialise or a device or port reset, on this or any other GlazLib
+        instance, as they all share the library's session; call this method
+        again to get a new one.
+        
+        Args:
+            index: Result index
+            
+        Returns:
+            Function taking no arguments and returning the 2D uint16 scan array
+            
+        Raises:
+            RuntimeError: If there are no scans to size the buffer from, or if
+                          getting the scan sizes fails
+        """
+        num_scans, pixels_per_scan = self.get_all_scans_sizes(index)
+        if num_scans <= 0 or pixels_per_scan <= 0:
+            raise RuntimeError("Failed to compile scan getter: no scans available, run a measurement first")
+        
+        # Allocated flat and reshaped, so the array is a view that
+        # release_scan_buffer refuses to pool
+        data = np.empty(num_scans * pixels_per_scan, dtype=np.uint16).reshape(num_scans, pixels_per_scan)
+        address = c_void_p(data.ctypes.data)
+        get_all_scans = lib._getAllScansAddress
+        epoch = _geometry_epoch
+        
+        def fast_get_all_scans() -> np.ndarray:
+            if _geometry_epoch != epoch:
+                raise RuntimeError("Scan geometry changed; call compile_fast_get_all_scans again")
+            status = get_all_scans(index, address)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to get all scans: {error_msg}")
+            return data
+        
+        return fast_get_all_scans
+    
+    def get_mean_scan(self, index: int = 0, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get the average of all scans for a result.
+        
+        This is a software complement to set_hardware_averaging, computed in a
+        single vectorized pass over the scan buffer.
+        
+        Args:
+            index: Result index
+            out: Optional writeable 1D float32 array of length pixels_per_scan
+                 to write the average into, so repeated calls need not
+                 allocate. When there are no scans it is left untouched.
+            
+        Returns:
+            1D float32 array with the mean intensity of each pixel, which is
+            out when given and there are scans, or an empty array when there
+            are no scans
+            
+        Raises:
+            ValueError: If out is not a writeable 1D float32 array of length
+                        pixels_per_scan
+            RuntimeError: If getting all scans fails
+        """
+        if out is not None and (out.dtype != np.float32 or out.ndim != 1 or not out.flags.writeable):
+            raise ValueError("out must be a writeable 1D float32 array")
+        num_scans, pixels_per_scan = self.get_all_scans_sizes(index)
+        if num_scans <= 0 or pixels_per_scan <= 0:
+            return np.array([], dtype=np.float32)
+        if out is not None and out.shape[0] != pixels_per_scan:
+            raise ValueError(f"out has length {out.shape[0]}, expected {pixels_per_scan}")
+        
+        all_scans = self.get_all_scans(index)
+        try:
+            # Reducing a 2D array over axis 0 always gives an array, not a scalar
+            return cast(np.ndarray, np.mean(all_scans, axis=0, dtype=np.float32, out=out))
+        finally:
+            self.release_scan_buffer(all_scans)
     
     def write_all_scans_to_file(self, index: int = 0, filename: str = "scans.dat", include_header: bool = True) -> None:
         """
@@ -729,11 +1262,49 @@ class GlazLib:
         Raises:
             RuntimeError: If writing the scans to file fails
         """
-        status = lib._lib.writeAllScansToFile(index, c_char_p(filename.encode('utf-8')), include_header)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        status = self._lib.writeAllScansToFile(index, os.fsencode(filename), include_header)
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to write all scans to file: {error_msg}")
     
+    def open_scans_memmap(self, filename: str, index: int = 0, shape: Optional[Tuple[int, int]] = None,
+                          offset: int = 0) -> np.ndarray:
+        """
+        Memory-map a binary scan file read-only.
+        
+        Pages are only read from disk when the array is accessed, so a large scan
+        dump can be sliced for analysis without loading it into memory first.
+        
+        With the default offset of 0, this only fits files written by
+        write_all_scans_to_file with include_header=False. For files with a
+        header, pass the header length as offset.
+        
+        Args:
+            filename: File containing the raw uint16 scan block
+            index: Result index whose sizes are used when shape is None
+            shape: (num_scans, pixels_per_scan) of the stored block, or None to use
+                   the sizes of the current result
+            offset: Number of header bytes preceding the scan block
+            
+        Returns:
+            Read-only memmap array of shape (num_scans, pixels_per_scan)
+            
+        Raises:
+            RuntimeError: If getting the scan sizes fails
+            ValueError: If the file size after offset does not match the shape,
+                        e.g. because a header is present but offset is 0
+        """
+        if shape is None:
+            shape = self.get_all_scans_sizes(index)
+        expected = shape[0] * shape[1] * np.dtype(np.uint16).itemsize
+        actual = os.path.getsize(filename) - offset
+        if actual != expected:
+            raise ValueError(
+                f"Scan file {filename!r} holds {actual} bytes after offset {offset}, "
+                f"expected {expected} for shape {tuple(shape)}"
+            )
+        return np.memmap(filename, dtype=np.uint16, mode='r', shape=shape, offset=offset)
+    
     def get_pd_values(self, index: int = 0, channel: int = 0) -> Tuple[np.ndarray, int]:
         """
         Get photodiode values.
@@ -748,22 +1319,28 @@ class GlazLib:
         Raises:
             RuntimeError: If getting the photodiode values fails
         """
-        size = c_int()
-        status = lib._lib.getPDValues(index, channel, byref(size), None)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to get photodiode values size: {error_msg}")
+        size = _scratch.size
+        key = ('pd_values', index, channel)
+        cached = _size_cache.get(key)
+        if cached is None:
+            status = self._getPDValues(index, channel, byref(size), None)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to get photodiode values size: {error_msg}")
+            _size_cache[key] = size.value
+        else:
+            size.value = cached
         
         if size.value <= 0:
             return np.array([]), 0
         
-        values = (c_double * size.value)()
-        status = lib._lib.getPDValues(index, channel, byref(size), values)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        values = np.empty(size.value, dtype=np.float64)
+        status = self._getPDValues(index, channel, byref(size), values)
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to get photodiode values: {error_msg}")
         
-        return np.array([values[i] for i in range(size.value)]), size.value
+        return values, size.value
     
     def get_pd_reference(self, index: int = 0, channel: int = 0) -> float:
         """
@@ -779,14 +1356,14 @@ class GlazLib:
         Raises:
             RuntimeError: If getting the photodiode reference value fails
         """
-        value = c_double()
-        status = lib._lib.getPDReference(index, channel, byref(value))
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        value = _scratch.value
+        status = self._getPDReference(index, channel, byref(value))
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to get photodiode reference: {error_msg}")
-        return value.value
+        return float(value.value)
     
-    def get_aux_states(self, index: int = 0) -> Tuple[List[bool], int]:
+    def get_aux_states(self, index: int = 0) -> Tuple[np.ndarray, int]:
         """
         Get auxiliary states.
         
@@ -794,29 +1371,36 @@ class GlazLib:
             index: Result index
             
         Returns:
-            Tuple containing (states, size)
+            Tuple containing (states, size), where states is a bool array;
+            call states.tolist() if plain Python bools are needed
             
         Raises:
             RuntimeError: If getting the auxiliary states fails
         """
-        size = c_int()
-        status = lib._lib.getAUXStates(index, byref(size), None)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to get auxiliary states size: {error_msg}")
+        size = _scratch.size
+        key = ('aux_states', index, 0)
+        cached = _size_cache.get(key)
+        if cached is None:
+            status = self._getAUXStates(index, byref(size), None)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to get auxiliary states size: {error_msg}")
+            _size_cache[key] = size.value
+        else:
+            size.value = cached
         
         if size.value <= 0:
-            return [], 0
+            return np.array([], dtype=np.bool_), 0
         
-        states = (c_bool * size.value)()
-        status = lib._lib.getAUXStates(index, byref(size), states)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        states = np.empty(size.value, dtype=np.bool_)
+        status = self._getAUXStates(index, byref(size), states)
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"Failed to get auxiliary states: {error_msg}")
         
-        return [bool(states[i]) for i in range(size.value)], size.value
+        return states, size.value
     
-    def get_aux_cycle_counts(self, index: int = 0, channel: int = 0) -> Tuple[List[int], int]:
+    def get_aux_cycle_counts(self, index: int = 0, channel: int = 0) -> Tuple[np.ndarray, int]:
         """
         Get auxiliary cycle counts.
         
@@ -825,27 +1409,76 @@ class GlazLib:
             channel: Channel index
             
         Returns:
-            Tuple containing (counts, size)
+            Tuple containing (counts, size), where counts is a C int array;
+            call counts.tolist() if plain Python ints are needed
             
         Raises:
             RuntimeError: If getting the auxiliary cycle counts fails
         """
-        size = c_int()
-        status = lib._lib.getAUXCycleCounts(index, channel, byref(size), None)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to get auxiliary cycle counts size: {error_msg}")
+        key = ('aux_cycle_counts', index, channel)
+        size = _size_cache.get(key)
+        if size is None:
+            status, size = _aux_cycle_counts(index, channel, None, 0)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to get auxiliary cycle counts size: {error_msg}")
+            _size_cache[key] = size
+        
+        if size <= 0:
+            return np.array([], dtype=np.intc), 0
+        
+        counts = np.empty(size, dtype=np.intc)
+        status, size = _aux_cycle_counts(index, channel, counts, size)
+        if status:
+            error_msg = _last_error_message()
+            raise RuntimeError(f"Failed to get auxiliary cycle counts: {error_msg}")
         
-        if size.value <= 0:
-            return [], 0
+        return counts, size
+    
+    def get_all_aux_cycle_counts(self, index: int, channels: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get auxiliary cycle counts for several channels at once.
         
-        counts = (c_int * size.value)()
-        status = lib._lib.getAUXCycleCounts(index, channel, byref(size), counts)
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
-            raise RuntimeError(f"Failed to get auxiliary cycle counts: {error_msg}")
+        The counts for all channels are written straight into the rows of one
+        2D array, avoiding a separate array and tuple per channel.
         
-        return [counts[i] for i in range(size.value)], size.value
+        Args:
+            index: Result index
+            channels: Channel indices, one row of the result per channel
+            
+        Returns:
+            Tuple containing (counts, sizes). counts is a 2D C int array with one
+            row per channel, zero-padded to the longest channel; sizes holds the
+            number of valid counts in each row.
+            
+        Raises:
+            RuntimeError: If getting the auxiliary cycle counts fails
+        """
+        sizes = np.zeros(len(channels), dtype=np.intc)
+        for row, channel in enumerate(channels):
+            key = ('aux_cycle_counts', index, channel)
+            size = _size_cache.get(key)
+            if size is None:
+                status, size = _aux_cycle_counts(index, channel, None, 0)
+                if status:
+                    error_msg = _last_error_message()
+                    raise RuntimeError(f"Failed to get auxiliary cycle counts size: {error_msg}")
+                _size_cache[key] = size
+            sizes[row] = max(size, 0)
+        
+        width = int(sizes.max()) if len(sizes) else 0
+        counts = np.zeros((len(sizes), width), dtype=np.intc)
+        for row, channel in enumerate(channels):
+            n = int(sizes[row])
+            if n == 0:
+                continue
+            # A leading slice of a row is contiguous, so the library fills it in place
+            status, _ = _aux_cycle_counts(index, channel, counts[row, :n], n)
+            if status:
+                error_msg = _last_error_message()
+                raise RuntimeError(f"Failed to get auxiliary cycle counts: {error_msg}")
+        
+        return counts, sizes
     
     def run_usb_comms_test(self) -> None:
         """
@@ -854,7 +1487,7 @@ class GlazLib:
         Raises:
             RuntimeError: If the USB communications test fails
         """
-        status = lib._lib.runUSBCommsTest()
-        if status != lib.ERROR_NONE:
-            error_msg = self.get_last_error_message()
+        status = _run_usb_comms_test()
+        if status:
+            error_msg = _last_error_message()
             raise RuntimeError(f"USB communications test failed: {error_msg}")
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+Test fixtures for the pyglaz package.
+
+The tests run without the GlazLib library or any hardware: pyglaz is imported
+against a fake library that answers every call with success and reports fixed
+result sizes.
+"""
+
+from unittest import mock
+
+import numpy as np
+import pytest
+
+
+class FakeFunction:
+    """Stand-in for a ctypes function pointer that counts its calls."""
+
+    def __init__(self, impl):
+        self.impl = impl
+        self.calls = 0
+        self.argtypes = None
+        self.restype = None
+        self.errcheck = None
+
+    def __call__(self, *args):
+        self.calls += 1
+        status = self.impl(*args)
+        if self.errcheck is not None:
+            return self.errcheck(status, self, args)
+        return status
+
+
+def _set(ref, value):
+    """Store value through a byref() argument."""
+    ref._obj.value = value
+
+
+class FakeGlazLib:
+    """Fake GlazLib handle reporting RESULT_SIZE points and SCANS scans."""
+
+    RESULT_SIZE = 8
+    SCANS = 3
+
+    def __init__(self):
+        self._name = 'fake-GlazLib'
+        self.size_queries = 0
+
+    def __getattr__(self, name):
+        # Functions not defined below succeed without doing anything; they are
+        # stored so that argtypes and errcheck set by the bindings stick
+        if name.startswith('_'):
+            raise AttributeError(name)
+        func = FakeFunction(getattr(self, '_' + name, lambda *args: 0))
+        setattr(self, name, func)
+        return func
+
+    def __getitem__(self, name):
+        return FakeFunction(lambda *args: 0)
+
+    def _isMeasurementDone(self, done):
+        _set(done, True)
+        return 0
+
+    def _getResult(self, index, size, data):
+        if data is None:
+            self.size_queries += 1
+        _set(size, self.RESULT_SIZE)
+        return 0
+
+    def _getAllScansSizes(self, index, num_scans, pixels_per_scan):
+        self.size_queries += 1
+        _set(num_scans, self.SCANS)
+        _set(pixels_per_scan, self.RESULT_SIZE)
+        return 0
+
+    def _getAllScans(self, index, data):
+        data[...] = np.arange(data.size, dtype=np.uint16).reshape(data.shape)
+        return 0
+
+
+FAKE_LIB = FakeGlazLib()
+
+# The bindings load the library on import, so pyglaz must first be imported
+# while the loader is pointed at the fake
+with mock.patch('ctypes.CDLL', return_value=FAKE_LIB), \
+        mock.patch('os.path.exists', return_value=True):
+    import pyglaz  # noqa: F401
+
+
+@pytest.fixture
+def fake_lib():
+    """The fake library handle, with its size query count reset."""
+    FAKE_LIB.size_queries = 0
+    return FAKE_LIB
+
+
+@pytest.fixture
+def glaz(fake_lib):
+    """A GlazLib session on the fake library."""
+    from pyglaz import GlazLib
+
+    session = GlazLib()
+    fake_lib.size_queries = 0
+    yield session
+    session.close()
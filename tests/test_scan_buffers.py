@@ -0,0 +1,49 @@
+"""
+Tests for reuse of scan buffers through release_scan_buffer.
+"""
+
+import numpy as np
+import pytest
+
+from conftest import FakeGlazLib
+from pyglaz import wrapper
+
+
+def test_released_buffer_is_reused(glaz):
+    scans = glaz.get_all_scans()
+    glaz.release_scan_buffer(scans)
+    assert glaz.get_all_scans() is scans
+
+
+def test_pool_is_capped_per_shape(glaz):
+    buffers = [glaz.get_all_scans() for _ in range(wrapper._MAX_IDLE_SCAN_BUFFERS + 2)]
+    for scans in buffers:
+        glaz.release_scan_buffer(scans)
+    assert len(wrapper._idle_scan_buffers[buffers[0].shape]) == wrapper._MAX_IDLE_SCAN_BUFFERS
+
+
+def test_pool_is_cleared_when_the_geometry_changes(glaz):
+    scans = glaz.get_all_scans()
+    glaz.release_scan_buffer(scans)
+    glaz.set_scan_count(5)
+    assert not wrapper._idle_scan_buffers
+    assert glaz.get_all_scans() is not scans
+
+
+def test_mean_scan_is_written_into_out(glaz):
+    out = np.empty(FakeGlazLib.RESULT_SIZE, dtype=np.float32)
+    assert glaz.get_mean_scan(out=out) is out
+    scans = np.arange(FakeGlazLib.SCANS * FakeGlazLib.RESULT_SIZE).reshape(FakeGlazLib.SCANS, -1)
+    np.testing.assert_allclose(out, scans.mean(axis=0))
+
+
+@pytest.mark.parametrize('out', [
+    np.empty(FakeGlazLib.RESULT_SIZE, dtype=np.float64),
+    np.empty(FakeGlazLib.RESULT_SIZE + 1, dtype=np.float32),
+    np.empty((1, FakeGlazLib.RESULT_SIZE), dtype=np.float32),
+], ids=['dtype', 'length', 'ndim'])
+def test_mean_scan_rejects_mismatched_out(glaz, out):
+    with pytest.raises(ValueError):
+        glaz.get_mean_scan(out=out)
+    # The check runs before any scan buffer is taken
+    assert not wrapper._idle_scan_buffers
@@ -0,0 +1,72 @@
+"""
+Tests for when GlazLib forgets its cached result sizes.
+"""
+
+import pytest
+
+from pyglaz import GlazLib
+
+
+def test_sizes_are_cached_between_calls(glaz, fake_lib):
+    glaz.get_result()
+    glaz.get_result()
+    glaz.get_all_scans_sizes()
+    glaz.get_all_scans_sizes()
+    assert fake_lib.size_queries == 2
+
+
+@pytest.mark.parametrize('change', [
+    lambda glaz: glaz.run_measurement(),
+    lambda glaz: glaz.capture_background(),
+    lambda glaz: glaz.set_scan_count(5),
+    lambda glaz: glaz.set_resolution(0),
+    lambda glaz: glaz.set_wavelengths(400.0, 800.0),
+    lambda glaz: glaz.reset_all_devices(),
+    lambda glaz: glaz.reset_all_ports(),
+    lambda glaz: glaz.reinitialise(),
+    lambda glaz: glaz.invalidate_size_cache(),
+], ids=['run_measurement', 'capture_background', 'set_scan_count', 'set_resolution',
+        'set_wavelengths', 'reset_all_devices', 'reset_all_ports', 'reinitialise',
+        'invalidate_size_cache'])
+def test_sizes_are_queried_again_after(glaz, fake_lib, change):
+    glaz.get_result()
+    glaz.get_all_scans_sizes()
+    change(glaz)
+    glaz.get_result()
+    glaz.get_all_scans_sizes()
+    assert fake_lib.size_queries == 4
+
+
+def test_non_blocking_measurement_invalidates_on_start_and_completion(glaz, fake_lib):
+    glaz.get_result()
+    glaz.start_measurement()
+    glaz.get_result()
+    assert fake_lib.size_queries == 2
+
+    # Sizes cached while the measurement ran are dropped once it completes,
+    # but later polls keep the cache
+    glaz.get_result()
+    assert glaz.is_measurement_done()
+    glaz.get_result()
+    assert glaz.is_measurement_done()
+    glaz.get_result()
+    assert fake_lib.size_queries == 3
+
+
+def test_settings_without_geometry_keep_the_cache(glaz, fake_lib):
+    glaz.get_result()
+    glaz.set_trigger_mode(0)
+    glaz.set_integration_time(100)
+    glaz.get_result()
+    assert fake_lib.size_queries == 1
+
+
+def test_cache_is_shared_by_all_instances(glaz, fake_lib):
+    other = GlazLib()
+    try:
+        glaz.get_result()
+        other.set_scan_count(5)
+        glaz.get_result()
+        assert fake_lib.size_queries == 2
+    finally:
+        other.close()